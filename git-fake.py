@@ -2,26 +2,82 @@ import os
 import random
 import argparse
 import logging
-from datetime import datetime, timedelta
-from faker import Faker
+import logging.handlers
+import queue
+from datetime import datetime, timedelta, timezone
+import numpy as np
+from faker import Generator as FakerGenerator
+from faker.providers.lorem.en_US import Provider as LoremProvider
 from git import Repo, Actor
+import pygit2
 import shutil
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+import multiprocessing
+
+class EmptyChangeError(Exception):
+    """Raised when a commit's file changes leave nothing to commit"""
+
 
 class GitCommitGenerator:
-    def __init__(self, repo_path='fake_repo', log_level=logging.INFO):
+    # Worker threads used to overlap file writes when flushing to the working tree
+    FILE_IO_WORKERS = 8
+    
+    # How many times a commit whose changes came out empty is retried with freshly drawn changes
+    MAX_CHANGE_REGENERATIONS = 3
+    
+    # Sizes of the Faker string pools built once per generator, file bodies are assembled from the word pool
+    SENTENCE_POOL_SIZE = 4096
+    PARAGRAPH_POOL_SIZE = 1024
+    WORD_POOL_SIZE = 1000
+    
+    # Index modes of regular files, the only entries the generator modifies or deletes
+    REGULAR_FILE_MODES = (pygit2.GIT_FILEMODE_BLOB, pygit2.GIT_FILEMODE_BLOB_EXECUTABLE)
+    
+    def __init__(self, repo_path='fake_repo', log_level=logging.INFO, seed=None):
         self.repo_path = os.path.abspath(repo_path)
-        self.fake = Faker()
+        self._path_prefix = self.repo_path + os.sep
+        self.log_level = log_level
+        self.seed = seed
+        
+        # Only lorem text is used, so skip loading Faker's full provider set
+        self.fake = FakerGenerator()
+        self.fake.add_provider(LoremProvider)
+        
+        # Seeding makes generated content and random decisions reproducible
+        if seed is not None:
+            self.fake.seed_instance(seed)
+            random.seed(seed)
+        self.rng = np.random.default_rng(seed)
         self.repo = None
+        self.pygit2_repo = None
+        self._head_commit = None
+        self._history_stats = None
+        
+        # Reference new commits are written to and prefix of generated file names
+        self.commit_ref = 'HEAD'
+        self.file_prefix = 'file'
+        
         self.authors = [
             Actor("Alice Developer", "alice@example.com"),
             Actor("Bob Contributor", "bob@example.com"),
             Actor("Charlie Maintainer", "charlie@example.com")
         ]
-        self.existing_files = set()
+        # Tracked files as a list for O(1) random choice, plus name -> list position
+        self.existing_files = []
+        self._file_index = {}
+        
+        # File contents held in memory (name -> bytearray) and names changed since the last flush
+        self._file_contents = {}
+        self._dirty_files = set()
         
         # Initialize logging
+        self._log_listener = None
         self.logger = self._setup_logger(log_level)
         
+        # Pre-generated Faker strings, so commits never call Faker directly
+        self._build_text_pools()
+        
     def _setup_logger(self, log_level):
         """Set up logger"""
         logger = logging.getLogger('GitCommitGenerator')
@@ -48,29 +104,49 @@ class GitCommitGenerator:
         
         log_file = os.path.join(log_dir, 'git_generator.log')
         file_handler = logging.FileHandler(log_file, encoding='utf-8')
-        file_handler.setLevel(logging.DEBUG)
+        file_handler.setLevel(logging.INFO)
         file_handler.setFormatter(formatter)
-        logger.addHandler(file_handler)
         
         # Error log file handler
         error_log_file = os.path.join(log_dir, 'git_generator_errors.log')
         error_handler = logging.FileHandler(error_log_file, encoding='utf-8')
         error_handler.setLevel(logging.ERROR)
         error_handler.setFormatter(formatter)
-        logger.addHandler(error_handler)
+        
+        # File handlers write from a background thread so disk I/O stays off the commit path
+        log_queue = queue.Queue(-1)
+        logger.addHandler(logging.handlers.QueueHandler(log_queue))
+        self._log_listener = logging.handlers.QueueListener(
+            log_queue, file_handler, error_handler, respect_handler_level=True
+        )
+        self._log_listener.start()
         
         return logger
+    
+    def close(self):
+        """Flush queued log records and stop the background log writer"""
+        if self._log_listener:
+            self._log_listener.stop()
+            self._log_listener = None
 
     def initialize_repo(self):
         """Initialize or load Git repository"""
         self.logger.info(f"Initializing repository: {self.repo_path}")
+        self._head_commit = None
+        self._history_stats = None
         
         try:
-            if not os.path.exists(self.repo_path):
+            # A missing or empty directory needs nothing removed, initialize it in place
+            if not os.path.exists(self.repo_path) or not os.listdir(self.repo_path):
                 self.logger.info(f"Creating new directory: {self.repo_path}")
-                os.makedirs(self.repo_path)
-                self.repo = Repo.init(self.repo_path)
-                self.existing_files = set()
+                os.makedirs(self.repo_path, exist_ok=True)
+                self.pygit2_repo = pygit2.init_repository(self.repo_path)
+                self.repo = Repo(self.repo_path)
+                self._disable_fsync()
+                self.existing_files = []
+                self._file_index = {}
+                self._file_contents = {}
+                self._dirty_files = set()
                 self.logger.info(f"Git repository initialized: {self.repo_path}")
             else:
                 if not os.path.exists(os.path.join(self.repo_path, '.git')):
@@ -78,6 +154,7 @@ class GitCommitGenerator:
                     self.logger.error(error_msg)
                     raise ValueError(error_msg)
                 
+                self.pygit2_repo = pygit2.Repository(self.repo_path)
                 self.repo = Repo(self.repo_path)
                 self.scan_existing_files()
                 self.logger.info(f"Loaded existing Git repository: {self.repo_path}")
@@ -86,152 +163,334 @@ class GitCommitGenerator:
             self.logger.error(f"Repository initialization failed: {e}")
             raise
     
+    def _disable_fsync(self):
+        """Skip fsync on git's own writes, a generated repository needs no durability"""
+        config = self.pygit2_repo.config
+        config['core.fsync'] = 'none'
+        self.logger.debug("Disabled fsync for repository object writes")
+    
     def scan_existing_files(self):
-        """Scan existing files in the repository"""
+        """Load the files tracked in the repository index"""
         self.logger.debug("Scanning existing files...")
-        self.existing_files = set()
+        self.existing_files = []
+        self._file_index = {}
+        self._file_contents = {}
+        self._dirty_files = set()
         file_count = 0
         
         try:
-            for root, _, files in os.walk(self.repo_path):
-                if '.git' in root:
-                    continue
-                for file in files:
-                    rel_path = os.path.relpath(os.path.join(root, file), self.repo_path)
-                    self.existing_files.add(rel_path)
+            # The index already lists every tracked file, no working tree walk needed;
+            # symlinks and submodules are left alone
+            for entry in self.pygit2_repo.index:
+                if entry.mode in self.REGULAR_FILE_MODES:
+                    self._track_file(entry.path)
                     file_count += 1
             
             self.logger.info(f"Scan completed, found {file_count} existing files")
-            self.logger.debug(f"Existing files list: {list(self.existing_files)}")
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug(f"Existing files list: {self.existing_files}")
             
         except Exception as e:
             self.logger.error(f"File scanning failed: {e}")
             raise
         
+    def _track_file(self, file_name):
+        """Add file to the tracked file list"""
+        if file_name not in self._file_index:
+            self._file_index[file_name] = len(self.existing_files)
+            self.existing_files.append(file_name)
+    
+    def _untrack_file(self, file_name):
+        """Remove file from the tracked file list by swapping in the last entry"""
+        i = self._file_index.pop(file_name)
+        last = self.existing_files.pop()
+        if i < len(self.existing_files):
+            self.existing_files[i] = last
+            self._file_index[last] = i
+    
+    def _build_text_pools(self):
+        """Pre-generate Faker strings so commit generation only samples from them"""
+        self.logger.debug("Pre-generating text pools...")
+        self._sentence_pool = [self.fake.sentence() for _ in range(self.SENTENCE_POOL_SIZE)]
+        self._paragraph_pool = [self.fake.paragraph() for _ in range(self.PARAGRAPH_POOL_SIZE)]
+        self._word_pool = self.fake.words(nb=self.WORD_POOL_SIZE)
+    
+    def _random_sentence(self):
+        """Return a random sentence from the pool"""
+        return random.choice(self._sentence_pool)
+    
+    def _random_paragraph(self):
+        """Return a random paragraph from the pool"""
+        return random.choice(self._paragraph_pool)
+    
+    def _random_words(self, count):
+        """Return count random words from the pool joined by spaces"""
+        return ' '.join(random.choices(self._word_pool, k=count))
+    
+    def _random_text(self):
+        """Return a random file body of 50 to 500 characters built from pooled words"""
+        length = random.randint(50, 500)
+        # Every word adds at least two characters with its separator, so this always reaches length
+        return self._random_words(length // 2 + 1)[:length]
+        
+    def _write_bytes(self, file_path, data):
+        """Write pre-encoded bytes with a single unbuffered write"""
+        fd = os.open(file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+        try:
+            os.write(fd, data)
+        finally:
+            os.close(fd)
+    
+    def _load_file(self, file_name):
+        """Return in-memory contents of file, reading its staged blob on first use"""
+        content = self._file_contents.get(file_name)
+        if content is None:
+            entry = self.pygit2_repo.index[file_name]
+            content = bytearray(self.pygit2_repo[entry.id].data)
+            self._file_contents[file_name] = content
+        return content
+        
     def _create_file(self, file_name):
-        """Create new file and return full path"""
-        self.logger.debug(f"Creating new file: {file_name}")
+        """Create new file in memory and return file name"""
+        self.logger.debug("Creating new file: %s", file_name)
         
         try:
-            file_path = os.path.join(self.repo_path, file_name)
-            content = self.fake.text(max_nb_chars=random.randint(50, 500))
+            text = self._random_text()
+            self._file_contents[file_name] = bytearray(text.encode('utf-8'))
+            self._dirty_files.add(file_name)
             
-            with open(file_path, 'w', encoding='utf-8') as f:
-                f.write(content)
-            
-            self.existing_files.add(file_name)
             self.logger.info(f"File created successfully: {file_name}")
-            return file_path
+            return file_name
             
         except Exception as e:
             self.logger.error(f"File creation failed {file_name}: {e}")
             raise
         
     def _modify_file(self, file_name):
-        """Modify existing file and return full path"""
-        self.logger.debug(f"Modifying file: {file_name}")
+        """Modify existing file in memory and return file name"""
+        self.logger.debug("Modifying file: %s", file_name)
         
         try:
-            file_path = os.path.join(self.repo_path, file_name)
-            additional_content = "\n" + self.fake.sentence()
-            
-            with open(file_path, 'a', encoding='utf-8') as f:
-                f.write(additional_content)
+            content = self._load_file(file_name)
+            content += ("\n" + self._random_words(8)).encode('utf-8')
+            self._dirty_files.add(file_name)
             
             self.logger.info(f"File modified successfully: {file_name}")
-            return file_path
+            return file_name
             
         except Exception as e:
             self.logger.error(f"File modification failed {file_name}: {e}")
             raise
         
     def _delete_file(self, file_name):
-        """Delete file and return file name"""
-        self.logger.debug(f"Deleting file: {file_name}")
+        """Delete file in memory and return file name"""
+        self.logger.debug("Deleting file: %s", file_name)
         
         try:
-            file_path = os.path.join(self.repo_path, file_name)
-            os.remove(file_path)
-            self.existing_files.remove(file_name)
+            self._file_contents.pop(file_name, None)
+            self._dirty_files.add(file_name)
             self.logger.info(f"File deleted successfully: {file_name}")
-            return file_path
+            return file_name
             
         except Exception as e:
             self.logger.error(f"File deletion failed {file_name}: {e}")
             raise
         
-    def generate_random_file_change(self):
-        """Generate random file change, return changed file name"""
+    def _pick_author(self):
+        """Pick a random author with one random() call instead of random.choice's rejection sampling"""
+        return self.authors[int(random.random() * len(self.authors))]
+    
+    def plan_random_file_change(self, rolls=None):
+        """Choose random file change and update tracked files, return (action, file name)
+        
+        rolls is an optional pre-drawn (create, action, pick) triple of floats in [0, 1)
+        """
+        if rolls is None:
+            rolls = (random.random(), random.random(), random.random())
+        create_roll, action_roll, pick_roll = rolls
+        
+        if not self.existing_files or create_roll < 0.3:  # 30% chance to create new file
+            file_name = f"{self.file_prefix}_{len(self.existing_files)+1}.txt"
+            action = 'create'
+            self._track_file(file_name)
+        else:
+            file_name = self.existing_files[int(pick_roll * len(self.existing_files))]
+            action = 'modify' if action_roll < 0.5 else 'delete'
+            if action == 'delete':
+                self._untrack_file(file_name)
+        
+        self.logger.debug("Selected operation: %s file %s", action, file_name)
+        return action, file_name
+    
+    def _sync_tracked_file(self, file_name):
+        """Re-align tracked files with the file contents after a failed change"""
+        index = self.pygit2_repo.index
+        exists = file_name in self._file_contents or (
+            file_name not in self._dirty_files and file_name in index
+            and index[file_name].mode in self.REGULAR_FILE_MODES
+        )
+        if exists and file_name not in self._file_index:
+            self._track_file(file_name)
+        elif not exists and file_name in self._file_index:
+            self._untrack_file(file_name)
+    
+    def generate_random_file_change(self, rolls=None):
+        """Generate random file change in memory, return changed file name or None on failure"""
+        action, file_name = self.plan_random_file_change(rolls)
         try:
-            if not self.existing_files or random.random() < 0.3:  # 30% chance to create new file
-                file_name = f"file_{len(self.existing_files)+1}.txt"
-                self.logger.debug(f"Selected operation: create new file {file_name}")
+            if action == 'create':
                 return self._create_file(file_name)
+            elif action == 'modify':
+                return self._modify_file(file_name)
             else:
-                file_name = random.choice(list(self.existing_files))
-                action = random.choice(['modify', 'delete'])
-                self.logger.debug(f"Selected operation: {action} file {file_name}")
+                return self._delete_file(file_name)
                 
-                if action == 'modify':
-                    return self._modify_file(file_name)
-                else:
-                    return self._delete_file(file_name)
-                    
         except Exception as e:
             self.logger.error(f"File change operation failed: {e}")
+            self._sync_tracked_file(file_name)
             return None
     
+    def generate_file_changes(self, num_changes, rolls=None):
+        """Generate several random file changes, return list of changed file names"""
+        changed_files = {}
+        generate_change = self.generate_random_file_change
+        for i in range(num_changes):
+            file_name = generate_change(rolls[i] if rolls else None)
+            if file_name:
+                changed_files[file_name] = None
+        return list(changed_files)
+    
+    def _write_worktree_file(self, file_name):
+        """Write in-memory contents of file to the working tree, or remove it if deleted"""
+        file_path = self._path_prefix + file_name
+        content = self._file_contents.get(file_name)
+        if content is not None:
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            self._write_bytes(file_path, content)
+        elif os.path.exists(file_path):
+            os.remove(file_path)
+    
+    def flush_to_disk(self):
+        """Write the staged index and all files changed in memory to disk"""
+        self.logger.debug("Flushing %d changed files to working tree", len(self._dirty_files))
+        
+        dirty_files = list(self._dirty_files)
+        if len(dirty_files) > 1:
+            with ThreadPoolExecutor(max_workers=self.FILE_IO_WORKERS) as executor:
+                list(executor.map(self._write_worktree_file, dirty_files))
+        else:
+            for file_name in dirty_files:
+                self._write_worktree_file(file_name)
+        
+        self._dirty_files.clear()
+        self.pygit2_repo.index.write()
+    
     def generate_commit_date(self, start_date=None, days_back=365):
         """Generate reasonable commit time series"""
         if not start_date:
             start_date = datetime.now()
         random_days = random.randint(0, days_back)
         random_seconds = random.randint(0, 86400)
-        commit_date = start_date - timedelta(days=random_days, seconds=random_seconds)
-        
-        self.logger.debug(f"Generated commit time: {commit_date}")
-        return commit_date
+        return start_date - timedelta(days=random_days, seconds=random_seconds)
     
-    def generate_commit(self, date=None):
-        """Generate single commit"""
+    def generate_commit(self, date=None, changes_per_commit=1, author=None, with_body=None, change_rolls=None,
+                        flush=True):
+        """Generate single commit containing one or more file changes
+        
+        author, with_body and change_rolls take pre-drawn random decisions; they are drawn here when omitted.
+        With flush=False the index and changed files are kept in memory only and the caller flushes them later.
+        Raises EmptyChangeError when the file changes leave nothing to commit.
+        """
         try:
-            self.logger.debug(f"Starting commit generation, time: {date}")
+            self.logger.debug("Starting commit generation, time: %s, changes: %d", date, changes_per_commit)
             
-            file_path = self.generate_random_file_change()
-            if not file_path:
-                self.logger.warning("File change failed, skipping this commit")
-                return False
+            changed_files = self.generate_file_changes(changes_per_commit, change_rolls)
+            if not changed_files:
+                raise EmptyChangeError("File change failed")
                 
-            author = random.choice(self.authors)
-            commit_message = self.fake.sentence()
-            if random.random() > 0.7:
-                commit_message += "\n\n" + self.fake.paragraph()
-            
-            self.logger.debug(f"Commit message: {commit_message[:50]}...")
-            self.logger.debug(f"Commit author: {author.name} <{author.email}>")
-            
-            # Use GitPython's git command directly
-            self.repo.git.add('--all')
+            if author is None:
+                author = self._pick_author()
+            if with_body is None:
+                with_body = random.random() > 0.7
+            
+            commit_message = self._random_sentence()
+            if with_body:
+                commit_message += "\n\n" + self._random_paragraph()
+            
+            if self.logger.isEnabledFor(logging.DEBUG):
+                self.logger.debug("Commit message: %s...", commit_message[:50])
+                self.logger.debug("Commit author: %s <%s>", author.name, author.email)
+            
+            # Stage and commit in-process through libgit2, no git subprocesses
+            # Stage only the touched paths, writing blobs straight from memory
+            index = self.pygit2_repo.index
+            for file_name in changed_files:
+                content = self._file_contents.get(file_name)
+                if content is not None:
+                    blob_id = self.pygit2_repo.create_blob(bytes(content))
+                    # Keep the mode of tracked files (e.g. executable), new files are plain blobs
+                    mode = index[file_name].mode if file_name in index else pygit2.GIT_FILEMODE_BLOB
+                    if mode not in self.REGULAR_FILE_MODES:
+                        mode = pygit2.GIT_FILEMODE_BLOB
+                    index.add(pygit2.IndexEntry(file_name, blob_id, mode))
+                elif file_name in index:
+                    index.remove(file_name)
+            tree = index.write_tree()
+            
+            # Chain commits from the last one created instead of re-reading HEAD every time
+            if self._head_commit is None:
+                try:
+                    self._head_commit = self.pygit2_repo.head.target
+                except pygit2.GitError:
+                    pass
+            parents = [self._head_commit] if self._head_commit else []
+            
+            if parents and self.pygit2_repo[parents[0]].tree_id == tree:
+                raise EmptyChangeError("Nothing to commit")
             
             if date:
-                date_str = date.strftime('%Y-%m-%d %H:%M:%S')
-                self.repo.git.commit(
-                    '-m', commit_message,
-                    '--date', date_str,
-                    '--author', f"{author.name} <{author.email}>"
-                )
+                signature = pygit2.Signature(author.name, author.email, int(date.timestamp()), 0)
             else:
-                self.repo.git.commit(
-                    '-m', commit_message,
-                    '--author', f"{author.name} <{author.email}>"
-                )
+                signature = pygit2.Signature(author.name, author.email)
+            
+            self._head_commit = self.pygit2_repo.create_commit(self.commit_ref, signature, signature, commit_message, tree, parents)
+            if flush:
+                self.flush_to_disk()
+            
+            # Keep cached statistics current so they never need a history walk after generation
+            if self._history_stats is not None:
+                commit_tz = timezone(timedelta(minutes=signature.offset))
+                self._record_commit(author.name, datetime.fromtimestamp(signature.time, commit_tz))
             
             self.logger.info(f"Commit successful - Author: {author.name}, Time: {date or 'current'}")
             return True
             
+        except EmptyChangeError:
+            raise
         except Exception as e:
             self.logger.error(f"Commit failed: {e}")
-            return False
+            raise
+    
+    def pack_objects(self):
+        """Pack objects and refs written during generation and prune unreachable leftovers"""
+        self.logger.debug("Packing repository objects...")
+        
+        try:
+            # One gc run repacks, packs refs and drops blobs/trees of regenerated empty commits
+            self.repo.git.gc('--prune=now')
+            self.logger.info("Repository objects packed")
+        except Exception as e:
+            self.logger.warning(f"Object packing failed: {e}")
+    
+    def _record_commit(self, author_name, commit_date):
+        """Add one commit to the cached history statistics"""
+        history = self._history_stats
+        history['total_commits'] += 1
+        history['authors'][author_name] += 1
+        if history['first_date'] is None or commit_date < history['first_date']:
+            history['first_date'] = commit_date
+        if history['last_date'] is None or commit_date > history['last_date']:
+            history['last_date'] = commit_date
     
     def get_repo_statistics(self):
         """Get repository statistics"""
@@ -246,45 +505,36 @@ class GitCommitGenerator:
             stats['is_bare'] = self.repo.bare
             stats['active_branch'] = self.repo.active_branch.name if not self.repo.bare else 'N/A'
             
-            # Commit information
-            commits = list(self.repo.iter_commits())
-            stats['total_commits'] = len(commits)
-            
-            if commits:
-                stats['first_commit'] = commits[-1].committed_datetime.strftime('%Y-%m-%d %H:%M:%S')
-                stats['last_commit'] = commits[0].committed_datetime.strftime('%Y-%m-%d %H:%M:%S')
-            else:
-                stats['first_commit'] = 'N/A'
-                stats['last_commit'] = 'N/A'
-            
-            # Author statistics
-            authors = {}
-            for commit in commits:
-                author = commit.author.name
-                if author in authors:
-                    authors[author] += 1
-                else:
-                    authors[author] = 1
-            
-            stats['authors'] = authors
-            stats['total_authors'] = len(authors)
-            
-            # File statistics
-            stats['total_files'] = len(self.existing_files)
-            stats['files_list'] = list(self.existing_files)
+            # Commit and author information, walked once and then kept up to date by generate_commit
+            if self._history_stats is None:
+                self._history_stats = {'total_commits': 0, 'first_date': None, 'last_date': None, 'authors': Counter()}
+                commits = self.repo.iter_commits() if self.repo.head.is_valid() else []
+                for commit in commits:
+                    self._record_commit(commit.author.name, commit.committed_datetime)
+            
+            history = self._history_stats
+            stats['total_commits'] = history['total_commits']
+            stats['first_commit'] = history['first_date'].strftime('%Y-%m-%d %H:%M:%S') if history['first_date'] else 'N/A'
+            stats['last_commit'] = history['last_date'].strftime('%Y-%m-%d %H:%M:%S') if history['last_date'] else 'N/A'
+            stats['authors'] = dict(history['authors'])
+            stats['total_authors'] = len(history['authors'])
+            
+            # File statistics from the index, i.e. what is actually tracked
+            files_list = [entry.path for entry in self.pygit2_repo.index]
+            stats['total_files'] = len(files_list)
+            stats['files_list'] = files_list
             
             # Branch information
             branches = [ref.name for ref in self.repo.refs if ref.name.startswith('refs/heads/')]
             stats['branches'] = branches
             stats['total_branches'] = len(branches)
             
-            # Repository size (approximate)
-            repo_size = 0
-            for root, dirs, files in os.walk(self.repo_path):
-                for file in files:
-                    file_path = os.path.join(root, file)
-                    if os.path.exists(file_path):
-                        repo_size += os.path.getsize(file_path)
+            # Repository size (approximate) from git's object counts instead of walking the tree
+            object_sizes = {}
+            for line in self.repo.git.count_objects('-v').splitlines():
+                key, _, value = line.partition(':')
+                object_sizes[key] = int(value)
+            repo_size = (object_sizes.get('size', 0) + object_sizes.get('size-pack', 0)) * 1024
             
             stats['repo_size_mb'] = round(repo_size / (1024 * 1024), 2)
             
@@ -322,8 +572,10 @@ class GitCommitGenerator:
         self.logger.info("-" * 40)
         self.logger.info("Author Information:")
         self.logger.info(f"  Total Authors: {stats['total_authors']}")
-        for author, count in sorted(stats['authors'].items(), key=lambda x: x[1], reverse=True):
-            self.logger.info(f"  {author}: {count} commits")
+        # Skip the sorts entirely when INFO output is suppressed
+        if self.logger.isEnabledFor(logging.INFO):
+            for author, count in sorted(stats['authors'].items(), key=lambda x: x[1], reverse=True):
+                self.logger.info(f"  {author}: {count} commits")
         
         # Branch information
         self.logger.info("-" * 40)
@@ -336,7 +588,7 @@ class GitCommitGenerator:
         self.logger.info("-" * 40)
         self.logger.info("File Information:")
         self.logger.info(f"  Total Files: {stats['total_files']}")
-        if stats['files_list']:
+        if stats['files_list'] and self.logger.isEnabledFor(logging.INFO):
             self.logger.info("  File List:")
             for file in sorted(stats['files_list']):
                 self.logger.info(f"    {file}")
@@ -382,9 +634,143 @@ class GitCommitGenerator:
             self.logger.info(f"  {commit['message']}")
             self.logger.info("")
     
-    def generate_history(self, num_commits=20, days_back=365):
-        """Generate commit history"""
-        self.logger.info(f"Starting commit history generation - Commits: {num_commits}, Time span: {days_back} days")
+    def _run_commit_plan(self, commit_plan, changes_per_commit):
+        """Generate commits from (date, author index, with body, change rolls) tuples, return (successful, failed)"""
+        successful_commits = 0
+        failed_commits = 0
+        
+        # Bind hot-loop lookups once rather than per commit
+        generate_commit = self.generate_commit
+        log_info = self.logger.info
+        authors = self.authors
+        total = len(commit_plan)
+        
+        for i, (date, author_index, with_body, rolls) in enumerate(commit_plan, 1):
+            log_info("Processing commit %d/%d...", i, total)
+            
+            # Only an empty change set is recoverable, by drawing new changes; other errors propagate
+            for regeneration in range(self.MAX_CHANGE_REGENERATIONS + 1):
+                try:
+                    generate_commit(date, changes_per_commit, authors[author_index], with_body, rolls, flush=False)
+                    successful_commits += 1
+                    break
+                except EmptyChangeError as e:
+                    self.logger.warning(f"{e}, regenerating file changes")
+                    rolls = None
+            else:
+                failed_commits += 1
+                self.logger.error(f"Commit {i} skipped, changes stayed empty after {self.MAX_CHANGE_REGENERATIONS} regenerations")
+        
+        return successful_commits, failed_commits
+    
+    def generate_branch(self, worker_id, commit_plan, changes_per_commit):
+        """Generate commits on a branch of their own on top of HEAD, return (branch ref, file prefix, tip id, successful, failed)
+        
+        Only files created on the branch are touched, so branches from different workers never conflict.
+        The repository index file and working tree are left untouched.
+        """
+        self.pygit2_repo = pygit2.Repository(self.repo_path)
+        self.commit_ref = f"refs/heads/gen-{worker_id}"
+        self.file_prefix = f"file_{worker_id}"
+        
+        successful_commits, failed_commits = self._run_commit_plan(commit_plan, changes_per_commit)
+        
+        tip = str(self._head_commit) if successful_commits else None
+        return self.commit_ref, self.file_prefix, tip, successful_commits, failed_commits
+    
+    def _generate_parallel(self, workers, commit_plan, changes_per_commit):
+        """Generate commit plan on one branch per worker process and merge them, return (successful, failed)"""
+        merge_date = max(date for date, _, _, _ in commit_plan)
+        
+        # Branches must fork from a shared commit, so an unborn HEAD gets its root commit here first
+        base_successful = base_failed = 0
+        while commit_plan and self.pygit2_repo.head_is_unborn:
+            successful, failed = self._run_commit_plan(commit_plan[:1], changes_per_commit)
+            base_successful += successful
+            base_failed += failed
+            commit_plan = commit_plan[1:]
+        if not commit_plan:
+            return base_successful, base_failed
+        
+        # Workers start from the on-disk index, so bring it in line with HEAD first
+        self.flush_to_disk()
+        
+        chunk_size = -(-len(commit_plan) // workers)
+        chunks = [commit_plan[i:i + chunk_size] for i in range(0, len(commit_plan), chunk_size)]
+        self.logger.info(f"Generating commits on {len(chunks)} branches in parallel")
+        
+        # Derive a distinct seed per worker so seeded parallel runs stay reproducible
+        worker_seeds = [None if self.seed is None else self.seed + worker_id + 1 for worker_id in range(len(chunks))]
+        
+        context = multiprocessing.get_context('spawn')
+        try:
+            with ProcessPoolExecutor(max_workers=len(chunks), mp_context=context) as executor:
+                futures = [
+                    executor.submit(_generate_branch, self.repo_path, self.log_level, worker_seeds[worker_id], worker_id,
+                                    chunk, changes_per_commit)
+                    for worker_id, chunk in enumerate(chunks)
+                ]
+                results = [future.result() for future in futures]
+            
+            successful_commits = base_successful + sum(result[3] for result in results)
+            failed_commits = base_failed + sum(result[4] for result in results)
+            
+            branches = [(ref, prefix, tip) for ref, prefix, tip, _, _ in results if tip]
+            if branches:
+                self._merge_branches(branches, merge_date)
+        finally:
+            # Never leave temporary branches behind, also when a worker or the merge failed
+            for worker_id in range(len(chunks)):
+                ref = f"refs/heads/gen-{worker_id}"
+                if ref in self.pygit2_repo.references:
+                    self.pygit2_repo.references.delete(ref)
+        
+        return successful_commits, failed_commits
+    
+    def _merge_branches(self, branches, date):
+        """Merge generated branches into HEAD with a single octopus commit"""
+        # Each branch owns the files with its prefix, take their state from the branch tip
+        index = self.pygit2_repo.index
+        for ref, prefix, tip in branches:
+            branch_files = {entry.name: entry for entry in self.pygit2_repo[tip].tree
+                            if entry.name.startswith(prefix + '_')}
+            
+            removed = [entry.path for entry in index
+                       if entry.path.startswith(prefix + '_') and entry.path not in branch_files]
+            for file_name in removed:
+                index.remove(file_name)
+                self._file_contents.pop(file_name, None)
+                self._dirty_files.add(file_name)
+                if file_name in self._file_index:
+                    self._untrack_file(file_name)
+            
+            for file_name, entry in branch_files.items():
+                index.add(pygit2.IndexEntry(file_name, entry.id, entry.filemode))
+                self._file_contents[file_name] = bytearray(entry.data)
+                self._dirty_files.add(file_name)
+                self._track_file(file_name)
+        tree = index.write_tree()
+        
+        if self._head_commit is None:
+            try:
+                self._head_commit = self.pygit2_repo.head.target
+            except pygit2.GitError:
+                pass
+        parents = [self._head_commit] if self._head_commit else []
+        parents += [pygit2.Oid(hex=tip) for _, _, tip in branches]
+        
+        author = self._pick_author()
+        signature = pygit2.Signature(author.name, author.email, int(date.timestamp()), 0)
+        message = f"Merge {len(branches)} generated branches"
+        self._head_commit = self.pygit2_repo.create_commit(self.commit_ref, signature, signature, message, tree, parents)
+        
+        # Worker commits bypassed the cached statistics, walk history again on next use
+        self._history_stats = None
+        self.logger.info(f"Merged {len(branches)} generated branches")
+    
+    def generate_history(self, num_commits=20, days_back=365, changes_per_commit=1, workers=1):
+        """Generate commit history, optionally on several branches generated in parallel worker processes"""
+        self.logger.info(f"Starting commit history generation - Commits: {num_commits}, Time span: {days_back} days, Changes per commit: {changes_per_commit}, Workers: {workers}")
         
         try:
             # Record start time
@@ -397,38 +783,34 @@ class GitCommitGenerator:
             if initial_stats:
                 self.logger.info(f"Repository state before generation: {initial_stats['total_commits']} commits, {initial_stats['total_files']} files")
             
-            # Generate time series (ensure time increment)
-            self.logger.debug("Generating commit time series...")
-            commit_dates = sorted(
-                [self.generate_commit_date(days_back=days_back) for _ in range(num_commits)],
-                reverse=True
-            )
+            # Pre-roll every random decision of the run in a few vectorized draws
+            self.logger.debug("Pre-rolling random decisions...")
+            offsets = self.rng.integers(0, days_back * 86400 + 86401, num_commits)
+            author_indexes = self.rng.integers(0, len(self.authors), num_commits).tolist()
+            body_flags = (self.rng.random(num_commits) > 0.7).tolist()
+            change_rolls = self.rng.random((num_commits, changes_per_commit, 3)).tolist()
             
-            self.logger.debug(f"Time series generation completed, range: {commit_dates[-1]} to {commit_dates[0]}")
+            # Generate time series (ensure time increment): sort offsets in NumPy, largest offset first
+            self.logger.debug("Generating commit time series...")
+            offsets.sort()
+            now = datetime.now()
+            commit_dates = [now - timedelta(seconds=offset) for offset in offsets[::-1].tolist()]
             
-            successful_commits = 0
-            failed_commits = 0
+            self.logger.debug(f"Time series generation completed, range: {commit_dates[0]} to {commit_dates[-1]}")
             
-            for i, date in enumerate(commit_dates, 1):
-                self.logger.info(f"Processing commit {i}/{num_commits}...")
-                
-                success = False
-                attempts = 0
-                max_attempts = 3
-                
-                while not success and attempts < max_attempts:
-                    attempts += 1
-                    self.logger.debug(f"Attempt {attempts}...")
-                    success = self.generate_commit(date)
-                    
-                    if not success and attempts < max_attempts:
-                        self.logger.warning(f"Attempt {attempts} failed, retrying...")
-                
-                if success:
-                    successful_commits += 1
+            commit_plan = list(zip(commit_dates, author_indexes, body_flags, change_rolls))
+            try:
+                if workers > 1:
+                    successful_commits, failed_commits = self._generate_parallel(workers, commit_plan, changes_per_commit)
                 else:
-                    failed_commits += 1
-                    self.logger.error(f"Commit {i} failed after {max_attempts} attempts")
+                    successful_commits, failed_commits = self._run_commit_plan(commit_plan, changes_per_commit)
+            finally:
+                # Write the index and working tree kept in memory during the loop once,
+                # even on failure, so they always match the last commit created
+                self.flush_to_disk()
+            
+            # Pack the loose objects once instead of leaving one per blob/tree/commit
+            self.pack_objects()
             
             # Calculate execution time
             end_time = datetime.now()
@@ -448,6 +830,24 @@ class GitCommitGenerator:
             self.logger.error(f"Commit history generation failed: {e}")
             raise
 
+def _generate_branch(repo_path, log_level, seed, worker_id, commit_plan, changes_per_commit):
+    """Worker process entry point for GitCommitGenerator.generate_branch"""
+    generator = GitCommitGenerator(repo_path=repo_path, log_level=log_level, seed=seed)
+    try:
+        return generator.generate_branch(worker_id, commit_plan, changes_per_commit)
+    finally:
+        generator.close()
+
+def positive_int(value):
+    """Argument type accepting integers of at least 1"""
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid integer value: {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"must be at least 1, got {value}")
+    return number
+
 def setup_argument_parser():
     """Set up command line argument parser"""
     parser = argparse.ArgumentParser(description='Generate fake Git commit history')
@@ -457,9 +857,15 @@ def setup_argument_parser():
                        help='Number of commits to generate (default: 5)')
     parser.add_argument('--days-back', type=int, default=10,
                        help='Time span in days (default: 10)')
+    parser.add_argument('--seed', type=int, default=None,
+                       help='Random seed for reproducible content and decisions (default: unseeded)')
     parser.add_argument('--log-level', type=str, default='INFO',
                        choices=['DEBUG', 'INFO', 'WARNING', 'ERROR'],
                        help='Log level (default: INFO)')
+    parser.add_argument('--changes-per-commit', type=positive_int, default=1,
+                       help='Number of file changes batched into each commit (default: 1)')
+    parser.add_argument('--workers', type=positive_int, default=1,
+                       help='Number of worker processes generating commits in parallel (default: 1)')
     parser.add_argument('--show-info-only', action='store_true',
                        help='Only show existing repository information, do not generate new commits')
     return parser
@@ -471,8 +877,9 @@ if __name__ == "__main__":
     # Convert log level
     log_level = getattr(logging, args.log_level.upper())
     
+    generator = None
     try:
-        generator = GitCommitGenerator(repo_path=args.repo, log_level=log_level)
+        generator = GitCommitGenerator(repo_path=args.repo, log_level=log_level, seed=args.seed)
         
         if args.show_info_only:
             # Info-only mode
@@ -481,8 +888,12 @@ if __name__ == "__main__":
             generator.display_recent_commits()
         else:
             # Normal generation mode
-            generator.generate_history(num_commits=args.num_commits, days_back=args.days_back)
+            generator.generate_history(num_commits=args.num_commits, days_back=args.days_back,
+                                       changes_per_commit=args.changes_per_commit, workers=args.workers)
             
     except Exception as e:
         logging.error(f"Program execution failed: {e}")
         exit(1)
+    finally:
+        if generator:
+            generator.close()